@@ -7,6 +7,7 @@ evaluation, and user-facing reporting.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from itertools import islice
 from typing import Any, Callable, Iterable
 import time
 
@@ -40,18 +41,7 @@ class SequenceValue:
         """Read a half-open window from the sequence without exposing slicing."""
         if offset < 0 or limit < 0:
             raise ValueError("offset and limit must be non-negative")
-
-        items: list[Any] = []
-        index = 0
-        for value in self.iter_values():
-            if index < offset:
-                index += 1
-                continue
-            if len(items) >= limit:
-                break
-            items.append(value)
-            index += 1
-        return items
+        return list(islice(self.iter_values(), offset, offset + limit))
 
     @property
     def total_size(self) -> int | None:
@@ -7,6 +7,7 @@ cache results by structural identity rather than by construction order.
 from __future__ import annotations
 
 from dataclasses import is_dataclass, fields
+from functools import lru_cache
 from typing import Any
 import hashlib
 import json
@@ -43,8 +44,69 @@ def node_payload(node: NodeSpec) -> dict[str, Any]:
     }
 
 
+_SCALAR_ATTR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def _scalar_attrs_key(attrs: dict[str, Any]) -> tuple[tuple[str, type, Any], ...] | None:
+    """Return a hashable key for attrs holding only scalars, else ``None``.
+
+    The value type is part of the key because ``1``, ``1.0`` and ``True``
+    compare equal but serialize differently. Floats are keyed by
+    ``float.hex`` for the same reason: ``0.0 == -0.0``.
+    """
+    key = []
+    for name, value in attrs.items():
+        value_type = type(value)
+        if value_type not in _SCALAR_ATTR_TYPES:
+            return None
+        if value_type is float:
+            value = value.hex()
+        key.append((str(name), value_type, value))
+    key.sort(key=lambda item: item[0])
+    return tuple(key)
+
+
+@lru_cache(maxsize=65536)
+def _hash_scalar_node(
+    kind: str,
+    operator: str,
+    args: tuple[NodeId, ...],
+    kwargs: tuple[tuple[str, NodeId], ...],
+    attrs_key: tuple[tuple[str, type, Any], ...],
+    output_kind: str,
+) -> NodeId:
+    payload = {
+        "kind": kind,
+        "operator": operator,
+        "args": list(args),
+        "kwargs": [[key, value] for key, value in kwargs],
+        "attrs": {
+            name: float.fromhex(value) if value_type is float else value
+            for name, value_type, value in attrs_key
+        },
+        "output_kind": output_kind,
+    }
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=True)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
 def hash_node(node: NodeSpec) -> NodeId:
     """Hash one symbolic node into its stable DAG identifier."""
+    # Constants and plain primitive calls recur constantly during reduction;
+    # memoize their digests instead of re-serializing the same payload.
+    attrs_key = _scalar_attrs_key(node.attrs)
+    if attrs_key is not None:
+        try:
+            return _hash_scalar_node(
+                node.kind,
+                node.operator,
+                node.args,
+                node.normalized_kwargs(),
+                attrs_key,
+                node.output_kind,
+            )
+        except TypeError:
+            pass
     payload = node_payload(node)
     canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=True)
     return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
@@ -7,9 +7,10 @@ in later stages.
 """
 
 from dataclasses import dataclass
-from typing import List, Union
+from typing import List, Sequence, Union
+import sys
 from pathlib import Path
-from lark import Lark, Transformer, v_args, Tree
+from lark import Lark, Transformer, v_args
 from lark.exceptions import UnexpectedInput
 
 Position = str
@@ -58,15 +59,15 @@ class ProgramParseError(ValueError):
         return self.format_block()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Expression:
     """Base class for expressions in the VoxLogicA language"""
 
     @staticmethod
     def create_call(
-        position: Position, identifier: str, args: List["Expression"]
+        position: Position, identifier: str, args: Sequence["Expression"]
     ) -> "ECall":
-        return ECall(position, identifier, args)
+        return ECall(position, identifier, tuple(args))
 
     @staticmethod
     def create_number(value: float) -> "ENumber":
@@ -74,43 +75,43 @@ class Expression:
 
     @staticmethod
     def create_bool(value: bool) -> "EBool":
-        return EBool(value)
+        return _TRUE if value else _FALSE
 
     @staticmethod
     def create_string(value: str) -> "EString":
         return EString(value)
 
     @staticmethod
-    def create_array(items: List["Expression"]) -> "EArray":
-        return EArray(items)
+    def create_array(items: Sequence["Expression"]) -> "EArray":
+        return EArray(tuple(items))
 
     def to_syntax(self) -> str:
         """Convert the expression to syntax form"""
         raise NotImplementedError("Must be implemented by subclasses")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ECall(Expression):
     """Function call expression"""
 
     position: Position
     identifier: str
-    arguments: List[Expression]
+    arguments: tuple[Expression, ...]
 
     def __str__(self) -> str:
         if not self.arguments:
             return f"{self.identifier}"
-        arg_str = [str(arg) for arg in self.arguments]
+        arg_str = ", ".join(str(arg) for arg in self.arguments)
         return f"{self.identifier}({arg_str})"
 
     def to_syntax(self) -> str:
         if not self.arguments:
             return f"{self.identifier}"
-        arg_str = ",".join([arg.to_syntax() for arg in self.arguments])
+        arg_str = ",".join(arg.to_syntax() for arg in self.arguments)
         return f"{self.identifier}({arg_str})"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ENumber(Expression):
     """Numeric literal expression"""
 
@@ -123,7 +124,7 @@ class ENumber(Expression):
         return f"{self.value}"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EBool(Expression):
     """Boolean literal expression"""
 
@@ -136,7 +137,12 @@ class EBool(Expression):
         return f"{self.value}".lower()
 
 
-@dataclass
+# Boolean literals carry no position, so every occurrence can share one node.
+_TRUE = EBool(True)
+_FALSE = EBool(False)
+
+
+@dataclass(frozen=True, slots=True)
 class EString(Expression):
     """String literal expression"""
 
@@ -149,11 +155,11 @@ class EString(Expression):
         return f'"{self.value}"'
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EArray(Expression):
     """Array literal expression."""
 
-    items: List[Expression]
+    items: tuple[Expression, ...]
 
     def __str__(self) -> str:
         return f"[{', '.join(str(item) for item in self.items)}]"
@@ -162,7 +168,7 @@ class EArray(Expression):
         return f"[{','.join(item.to_syntax() for item in self.items)}]"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ESlice(Expression):
     """Slice expression using bracket syntax."""
 
@@ -181,7 +187,7 @@ class ESlice(Expression):
         return f"{self.sequence.to_syntax()}[{start}:{stop}]"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EFor(Expression):
     """For loop expression"""
 
@@ -197,7 +203,7 @@ class EFor(Expression):
         return f"for {self.variable} in {self.iterable.to_syntax()} do {self.body.to_syntax()}"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EFilter(Expression):
     """Filter expression that keeps items matching a predicate."""
 
@@ -216,7 +222,7 @@ class EFilter(Expression):
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EFold(Expression):
     """Fold expression that reduces a sequence with a built-in combiner."""
 
@@ -238,7 +244,7 @@ class EFold(Expression):
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ELet(Expression):
     """Let expression for local variable binding"""
 
@@ -254,7 +260,7 @@ class ELet(Expression):
         return f"let {self.variable} = {self.value.to_syntax()} in {self.body.to_syntax()}"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Command:
     """Base class for commands in the VoxLogicA language"""
 
@@ -263,12 +269,12 @@ class Command:
         raise NotImplementedError("Must be implemented by subclasses")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Declaration(Command):
     """Variable or function declaration"""
 
     identifier: str
-    arguments: List[str]
+    arguments: tuple[str, ...]
     expression: Expression
 
     def to_syntax(self) -> str:
@@ -278,7 +284,7 @@ class Declaration(Command):
         return f"let {self.identifier}({args_str})={self.expression.to_syntax()}"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Save(Command):
     """Command to save an expression to a file"""
 
@@ -290,7 +296,7 @@ class Save(Command):
         return f'save "{self.identifier}" {self.expression.to_syntax()}'
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Print(Command):
     """Command to print an expression"""
 
@@ -302,7 +308,7 @@ class Print(Command):
         return f'print "{self.identifier}" {self.expression.to_syntax()}'
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Import(Command):
     """Command to import a file"""
 
@@ -312,14 +318,14 @@ class Import(Command):
         return f"import {self.path}"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Program:
     """A program consisting of a list of commands"""
 
-    commands: List[Command]
+    commands: tuple[Command, ...]
 
     def to_syntax(self) -> str:
-        return "\n".join([cmd.to_syntax() for cmd in self.commands])
+        return "\n".join(cmd.to_syntax() for cmd in self.commands)
 
     def __str__(self) -> str:
         return self.to_syntax()
@@ -329,7 +335,7 @@ class Program:
 grammar = r"""
     program: command*
     
-    command: let_cmd | assignment_cmd | save_cmd | print_cmd | import_cmd
+    ?command: let_cmd | assignment_cmd | save_cmd | print_cmd | import_cmd
     
     let_cmd: "let" variable_name formal_args? "=" expression
     assignment_cmd: variable_name formal_args? "=" expression
@@ -354,10 +360,10 @@ grammar = r"""
                       | "[" ":" "]"              -> postfix_slice_all
         ?primary_expr: simple_expr | array_expr | call_id_expr | call_op_expr | paren_expr
 
-        simple_expr: number | boolean | string
+        ?simple_expr: number | boolean | string
     call_id_expr: identifier actual_args?
     call_op_expr: OPERATOR actual_args
-    paren_expr: "(" expression ")"
+    ?paren_expr: "(" expression ")"
         array_expr: "[" [expression ("," expression)*] "]"
     for_expr: "for" identifier "in" expression "do" expression
     filter_expr: "filter" identifier "in" expression "do" expression
@@ -396,8 +402,13 @@ grammar = r"""
 """
 
 
+@v_args(inline=True)
 class VoxLogicATransformer(Transformer):
-    """Transform the parse tree into the AST."""
+    """Transform the parse tree into the AST.
+
+    Children are passed inline to every callback; rules that also need source
+    positions opt into ``meta`` individually.
+    """
 
     def __init__(self, source_name: str = "<input>") -> None:
         self.source_name = source_name
@@ -405,36 +416,20 @@ class VoxLogicATransformer(Transformer):
     def _pos(self, meta: object | None) -> Position:
         return format_position(self.source_name, meta)
 
-    @v_args(inline=True)
     def program(self, *commands):
-        # Extract actual command objects from Tree objects if needed
-        processed_commands = []
-        for cmd in commands:
-            if isinstance(cmd, Tree) and cmd.data == "command" and cmd.children:
-                # Extract the actual command from the Tree's children
-                processed_commands.append(cmd.children[0])
-            else:
-                processed_commands.append(cmd)
-        return Program(processed_commands)
-
-    @v_args(inline=True)
-    def command(self, cmd):
-        # Just return the command directly
-        return cmd
-
-    @v_args(inline=True)
+        # ``?command`` is inlined by Lark, so children are already commands.
+        return Program(commands)
+
     def let_cmd(self, variable_name, *args):
         if len(args) == 1:  # No formal args, just the expression
-            return Declaration(variable_name, [], args[0])
+            return Declaration(variable_name, (), args[0])
         return Declaration(variable_name, args[0], args[1])
 
-    @v_args(inline=True)
     def assignment_cmd(self, variable_name, *args):
         if len(args) == 1:  # No formal args, just the expression
-            return Declaration(variable_name, [], args[0])
+            return Declaration(variable_name, (), args[0])
         return Declaration(variable_name, args[0], args[1])
 
-    @v_args(inline=True)
     def variable_name(self, name):
         return str(name)
 
@@ -446,22 +441,19 @@ class VoxLogicATransformer(Transformer):
     def print_cmd(self, meta, identifier, expression):
         return Print(self._pos(meta), identifier.value, expression)
 
-    @v_args(inline=True)
     def import_cmd(self, path):
         return Import(path.value)
 
-    @v_args(inline=True)
     def formal_args(self, *args):
-        return list(args)
+        return args
 
-    @v_args(inline=True)
     def actual_args(self, *args):
-        return list(args)
+        return args
 
     @v_args(meta=True, inline=True)
     def call_id_expr(self, meta, function_name, args=None):
         if args is None:
-            args = []
+            args = ()
         return ECall(self._pos(meta), function_name, args)
 
     @v_args(meta=True, inline=True)
@@ -475,50 +467,42 @@ class VoxLogicATransformer(Transformer):
         for index in indices:
             kind = index[0]
             if kind == "index":
-                current = ECall(position, "index", [current, index[1]])
+                current = ECall(position, "index", (current, index[1]))
                 continue
             current = ESlice(current, index[1], index[2])
         return current
 
-    @v_args(inline=True)
     def postfix_index(self, expr):
         return ("index", expr)
 
-    def postfix_slice_both(self, items):
-        return ("slice", items[0], items[1])
+    def postfix_slice_both(self, start, stop):
+        return ("slice", start, stop)
 
-    def postfix_slice_from(self, items):
-        return ("slice", items[0], None)
+    def postfix_slice_from(self, start):
+        return ("slice", start, None)
 
-    def postfix_slice_to(self, items):
-        return ("slice", None, items[0])
+    def postfix_slice_to(self, stop):
+        return ("slice", None, stop)
 
-    def postfix_slice_all(self, _items):
+    def postfix_slice_all(self):
         return ("slice", None, None)
 
     @v_args(meta=True, inline=True)
     def op_expr(self, meta, left, op, right):
-        return ECall(self._pos(meta), op, [left, right])
+        return ECall(self._pos(meta), op, (left, right))
 
     @v_args(meta=True, inline=True)
     def prefix_expr(self, meta, op, expr):
-        return ECall(self._pos(meta), op, [expr])
+        return ECall(self._pos(meta), op, (expr,))
 
-    @v_args(inline=True)
     def infix_operator(self, op):
         return str(op)
 
-    @v_args(inline=True)
     def prefix_operator(self, op):
         return str(op)
 
-    @v_args(inline=True)
-    def paren_expr(self, expr):
-        return expr
-
-    @v_args(inline=True)
     def array_expr(self, *items):
-        return EArray(list(items))
+        return EArray(items)
 
     @v_args(meta=True, inline=True)
     def for_expr(self, meta, variable, iterable, body):
@@ -540,65 +524,67 @@ class VoxLogicATransformer(Transformer):
     def let_expr(self, meta, variable, value, body):
         return ELet(self._pos(meta), str(variable), value, body)
 
-    @v_args(inline=True)
-    def simple_expr(self, value):
-        return value
-
-    @v_args(inline=True)
-    def expression(self, expr):
-        return expr
-
-    @v_args(inline=True)
     def identifier(self, identifier):
         return identifier
 
-    @v_args(inline=True)
+    # Names and operators recur throughout a program; interning them lets the
+    # reducer's dict lookups and equality checks hit the identity fast path.
     def IDENTIFIER(self, token):
-        return str(token)
+        return sys.intern(str(token))
 
-    @v_args(inline=True)
     def UPPER_IDENTIFIER(self, token):
-        return str(token)
+        return sys.intern(str(token))
 
-    @v_args(inline=True)
     def DOLLAR_IDENTIFIER(self, token):
-        return str(token)
+        return sys.intern(str(token))
 
-    @v_args(inline=True)
     def OPERATOR(self, token):
-        return str(token)
+        return sys.intern(str(token))
 
-    @v_args(inline=True)
     def float(self, token):
         return ENumber(float(token))
 
-    @v_args(inline=True)
     def true(self):
-        return EBool(True)
+        return _TRUE
 
-    @v_args(inline=True)
     def false(self):
-        return EBool(False)
+        return _FALSE
 
-    @v_args(inline=True)
     def string(self, token):
         # Remove the quotes from the string
         return EString(token[1:-1])
 
 
 # Base parser without a transformer; attach one per parse for source locations.
-_base_parser = Lark(
-    grammar,
-    start="program",
-    parser="lalr",
-    propagate_positions=True,
-    maybe_placeholders=False,
-)
+# Built on first use so importing the module does not pay for LALR table
+# construction; ``cache=True`` lets Lark reuse serialized tables across runs.
+_base_parser: Lark | None = None
+
+
+def _get_base_parser() -> Lark:
+    """Return the shared LALR parser, constructing it on first call."""
+    global _base_parser
+    if _base_parser is None:
+        _base_parser = Lark(
+            grammar,
+            start="program",
+            parser="lalr",
+            propagate_positions=True,
+            maybe_placeholders=False,
+            cache=True,
+        )
+    return _base_parser
+
+
+# Parsed files keyed by (resolved path, source name). Entries are revalidated
+# against the file's mtime and size, so edited files are parsed again. The
+# cached ``Program`` is shared between callers and must not be mutated.
+_parsed_file_cache: dict[tuple[str, str], tuple[tuple[int, int], Program]] = {}
 
 
 def parse_program(filename: Union[str, Path]) -> Program:
     """
-    Parse a VoxLogicA program from a file
+    Parse a VoxLogicA program from a file, reusing the result while it is unchanged
 
     Args:
         filename: Path to the file containing the program
@@ -607,8 +593,17 @@ def parse_program(filename: Union[str, Path]) -> Program:
         A Program object representing the parsed program
     """
     path = Path(filename) if not isinstance(filename, Path) else filename
+    source_name = str(path)
+    stat = path.stat()
+    key = (str(path.resolve()), source_name)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _parsed_file_cache.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
     program_text = path.read_text(encoding="utf-8")
-    return parse_program_content(program_text, source_name=str(path))
+    program = parse_program_content(program_text, source_name=source_name)
+    _parsed_file_cache[key] = (stamp, program)
+    return program
 
 
 def parse_import(filename: Union[str, Path]) -> List[Command]:
@@ -622,7 +617,7 @@ def parse_import(filename: Union[str, Path]) -> List[Command]:
         A list of commands from the imported file
     """
     program = parse_program(filename)
-    return program.commands
+    return list(program.commands)
 
 
 def parse_program_content(content: str, source_name: str = "<input>") -> Program:
@@ -637,7 +632,7 @@ def parse_program_content(content: str, source_name: str = "<input>") -> Program
     """
     # Attach a transformer with the requested source name for location strings.
     try:
-        tree = _base_parser.parse(content)
+        tree = _get_base_parser().parse(content)
         result = VoxLogicATransformer(source_name=source_name).transform(tree)
     except UnexpectedInput as exc:
         found = getattr(exc, "token", None)
@@ -114,6 +114,16 @@ def can_serialize_value(value: Any) -> tuple[bool, str | None, EncodedRecord | N
 
 def encode_for_storage(value: Any, *, page_size: int = 128) -> EncodedRecord:
     adapted = adapt_runtime_value(value)
+    if isinstance(adapted, VoxSequenceValue):
+        # Walk the items once and reuse the count for the descriptor.
+        items = adapted.to_json_native()
+        return EncodedRecord(
+            VOX_FORMAT_VERSION,
+            "sequence",
+            adapted.describe(path="", length=len(items)),
+            {"encoding": "sequence-json-v1", "value": items, "length": len(items)},
+        )
+
     descriptor = adapted.describe(path="")
     vox_type = str(descriptor.get("vox_type", adapted.vox_type))
 
@@ -160,15 +170,6 @@ def encode_for_storage(value: Any, *, page_size: int = 128) -> EncodedRecord:
             {"encoding": "mapping-json-v1", "value": adapted.to_json_native()},
         )
 
-    if isinstance(adapted, VoxSequenceValue):
-        items = adapted.to_json_native()
-        return EncodedRecord(
-            VOX_FORMAT_VERSION,
-            "sequence",
-            descriptor,
-            {"encoding": "sequence-json-v1", "value": items, "length": len(items)},
-        )
-
     if isinstance(adapted, VoxOverlayValue):
         layers = []
         for index, raw_layer in enumerate(adapted.raw.layers):
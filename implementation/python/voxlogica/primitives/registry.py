@@ -8,7 +8,7 @@ from __future__ import annotations
 
 from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, Iterator
 import importlib
 import inspect
 import logging
@@ -45,6 +45,7 @@ class PrimitiveRegistry:
         self._imgql_exports_by_namespace: dict[str, tuple[Command, ...]] = {}
         self._loaded_namespaces: set[str] = set()
         self._legacy_warning_emitted: set[str] = set()
+        self._all_imported = False
 
         self._discover_namespaces()
         self.import_namespace("default")
@@ -287,6 +288,19 @@ class PrimitiveRegistry:
         """Resolve a primitive name and return only its symbolic specification."""
         return self.resolve(name)
 
+    def import_all_namespaces(self) -> None:
+        """Import every known namespace; later calls are no-ops."""
+        if self._all_imported:
+            return
+        for namespace in self.list_namespaces():
+            self.import_namespace(namespace)
+        self._all_imported = True
+
+    def iter_all_specs(self) -> Iterator[PrimitiveSpec]:
+        """Import every namespace once, then yield all registered specs."""
+        self.import_all_namespaces()
+        yield from tuple(self._specs_by_qualified.values())
+
     def list_namespaces(self) -> list[str]:
         """List all known primitive namespaces in sorted order."""
         return sorted(self._specs_by_namespace.keys())
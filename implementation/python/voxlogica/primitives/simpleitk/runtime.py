@@ -90,6 +90,8 @@ def _wrap_sitk_function(func: Callable, func_name: str) -> Callable:
 
 def _iter_sitk_functions():
     """Yield callable SimpleITK functional APIs exposed as primitives."""
+    # Skip lines are dropped unless verbose logging is on; check the level once.
+    verbose = logger.isEnabledFor(VERBOSE_LEVEL)
     for name in dir(sitk):
         if name.startswith("_"):
             continue
@@ -102,14 +104,18 @@ def _iter_sitk_functions():
         if name.endswith("Filter") or name.endswith("ImageFilter"):
             functional_name = name.replace("ImageFilter", "").replace("Filter", "")
             if hasattr(sitk, functional_name) and functional_name != name:
-                logger.log(
-                    VERBOSE_LEVEL,
-                    f"Skipping filter class {name}, preferring functional {functional_name}",
-                )
+                if verbose:
+                    logger.log(
+                        VERBOSE_LEVEL,
+                        "Skipping filter class %s, preferring functional %s",
+                        name,
+                        functional_name,
+                    )
                 continue
 
         if isinstance(attr, type):
-            logger.log(VERBOSE_LEVEL, f"Skipping class constructor: {name}")
+            if verbose:
+                logger.log(VERBOSE_LEVEL, "Skipping class constructor: %s", name)
             continue
 
         yield name, attr
@@ -218,7 +218,7 @@ class FunctionVal:
     """Function value used for declaration-level closures."""
 
     environment: "Environment"
-    parameters: list[identifier]
+    parameters: Sequence[identifier]
     expression: Expression
 
 
@@ -242,7 +242,7 @@ class Environment:
         new_bindings[ide] = expr
         return Environment(new_bindings)
 
-    def bind_list(self, ide_list: list[identifier], expr_list: Sequence[DVal]) -> "Environment":
+    def bind_list(self, ide_list: Sequence[identifier], expr_list: Sequence[DVal]) -> "Environment":
         """Return a new environment extended by multiple aligned bindings."""
         if len(ide_list) != len(expr_list):
             raise RuntimeError("Reducer internal error: arity mismatch")
@@ -593,7 +593,7 @@ def _reduce_map_call(
             expression=ECall(
                 "pos",
                 function_expr.identifier,
-                [ECall("pos", map_parameter, [])],
+                (ECall("pos", map_parameter, ()),),
             ),
             environment=env,
             work_plan=work_plan,
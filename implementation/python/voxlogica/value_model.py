@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Iterable
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Callable, Iterable
 import math
 
 
@@ -53,7 +55,9 @@ class OverlayValue:
         )
 
 
+@lru_cache(maxsize=4096)
 def normalize_path(path: str | None) -> str:
+    """Return the canonical ``/``-prefixed form of a descriptor path (cached)."""
     raw = str(path or "").strip()
     if raw in {"", "/"}:
         return ""
@@ -76,6 +80,7 @@ def normalize_overlay_layer(layer: Any, *, index: int) -> OverlayLayer:
     )
 
 
+@lru_cache(maxsize=1)
 def _import_numpy():
     try:
         import numpy as np
@@ -85,6 +90,7 @@ def _import_numpy():
         return None
 
 
+@lru_cache(maxsize=1)
 def _import_simpleitk():
     try:
         import SimpleITK as sitk
@@ -94,18 +100,37 @@ def _import_simpleitk():
         return None
 
 
-def _is_sequence_value(value: Any) -> bool:
+def _is_simpleitk_image(value: Any) -> bool:
+    sitk = _import_simpleitk()
+    return sitk is not None and isinstance(value, sitk.Image)
+
+
+@lru_cache(maxsize=1)
+def _sequence_value_type() -> type | None:
+    # Imported lazily: the execution_strategy package imports this module.
     try:
         from voxlogica.execution_strategy.results import SequenceValue
 
-        return isinstance(value, SequenceValue)
+        return SequenceValue
     except Exception:
-        return False
+        return None
+
+
+def _is_sequence_value(value: Any) -> bool:
+    sequence_type = _sequence_value_type()
+    return sequence_type is not None and isinstance(value, sequence_type)
+
+
+# Exact types whose JSON-native form is the value itself. Floats are left out
+# because non-finite floats must still be rejected by adapt_runtime_value.
+_JSON_PASSTHROUGH_TYPES = frozenset({type(None), bool, int, str})
 
 
 class VoxValue:
     """Small descriptor adapter for values accepted by this branch."""
 
+    __slots__ = ("raw",)
+
     vox_type = "unknown"
 
     def __init__(self, raw: Any):
@@ -133,15 +158,25 @@ class VoxValue:
 
 
 class VoxScalarValue(VoxValue):
+    # Scalars pick their vox type per instance; it shadows the class default.
+    __slots__ = ("vox_type",)
+
     def __init__(self, raw: Any, vox_type: str):
         super().__init__(raw)
         self.vox_type = vox_type
 
     def describe(self, *, path: str = "") -> dict[str, Any]:
         payload = self.descriptor_base(path=path)
-        payload["summary"] = {"value": self.raw}
         if isinstance(self.raw, str):
-            payload["summary"] = {"length": len(self.raw), "value": self.raw[:2048], "truncated": len(self.raw) > 2048}
+            length = len(self.raw)
+            truncated = length > 2048
+            payload["summary"] = {
+                "length": length,
+                "value": self.raw[:2048] if truncated else self.raw,
+                "truncated": truncated,
+            }
+        else:
+            payload["summary"] = {"value": self.raw}
         return payload
 
     def to_json_native(self) -> Any:
@@ -149,6 +184,8 @@ class VoxScalarValue(VoxValue):
 
 
 class VoxBytesValue(VoxValue):
+    __slots__ = ()
+
     vox_type = "bytes"
 
     def describe(self, *, path: str = "") -> dict[str, Any]:
@@ -158,6 +195,8 @@ class VoxBytesValue(VoxValue):
 
 
 class VoxNdArrayValue(VoxValue):
+    __slots__ = ()
+
     vox_type = "ndarray"
 
     def describe(self, *, path: str = "") -> dict[str, Any]:
@@ -171,38 +210,67 @@ class VoxNdArrayValue(VoxValue):
 
 
 class VoxMappingValue(VoxValue):
+    __slots__ = ()
+
     vox_type = "mapping"
 
     def describe(self, *, path: str = "") -> dict[str, Any]:
         payload = self.descriptor_base(path=path, pageable=True, can_descend=True)
-        keys = list(self.raw.keys())
-        payload["summary"] = {"length": len(keys), "keys_preview": [str(key) for key in keys[:16]], "truncated": len(keys) > 16}
+        length = len(self.raw)
+        payload["summary"] = {
+            "length": length,
+            "keys_preview": [str(key) for key in islice(self.raw, 16)],
+            "truncated": length > 16,
+        }
         return payload
 
     def to_json_native(self) -> Any:
-        return {str(key): adapt_runtime_value(value).to_json_native() for key, value in self.raw.items()}
+        adapt = adapt_runtime_value
+        return {
+            str(key): value if type(value) in _JSON_PASSTHROUGH_TYPES else adapt(value).to_json_native()
+            for key, value in self.raw.items()
+        }
 
 
 class VoxSequenceValue(VoxValue):
+    __slots__ = ()
+
     vox_type = "sequence"
 
-    def _items(self) -> list[Any]:
+    def _items(self) -> Iterable[Any]:
         if _is_sequence_value(self.raw):
-            return list(self.raw.iter_values())
-        return list(self.raw)
+            return self.raw.iter_values()
+        # list/tuple/range are already iterable in C; avoid an intermediate copy.
+        return self.raw
 
-    def describe(self, *, path: str = "") -> dict[str, Any]:
+    def describe(self, *, path: str = "", length: int | None = None) -> dict[str, Any]:
+        """Describe the sequence; ``length`` spares a recount when the caller already walked it."""
         payload = self.descriptor_base(path=path, pageable=True, can_descend=True)
         total_size = getattr(self.raw, "total_size", None)
-        length = total_size if total_size is not None else len(self._items())
+        if total_size is not None:
+            length = total_size
+        elif length is None:
+            if _is_sequence_value(self.raw):
+                length = sum(1 for _ in self.raw.iter_values())
+            else:
+                length = len(self.raw)
         payload["summary"] = {"length": int(length)}
         return payload
 
     def to_json_native(self) -> Any:
-        return [adapt_runtime_value(item).to_json_native() for item in self._items()]
+        if isinstance(self.raw, range):
+            # A range only ever yields ints, which are already JSON-native.
+            return list(self.raw)
+        adapt = adapt_runtime_value
+        return [
+            item if type(item) in _JSON_PASSTHROUGH_TYPES else adapt(item).to_json_native()
+            for item in self._items()
+        ]
 
 
 class VoxOverlayValue(VoxValue):
+    __slots__ = ()
+
     vox_type = "overlay"
 
     def describe(self, *, path: str = "") -> dict[str, Any]:
@@ -216,32 +284,49 @@ class VoxOverlayValue(VoxValue):
 
 
 class VoxImageValue(VoxValue):
+    __slots__ = ("_metadata",)
+
     vox_type = "image"
 
+    def __init__(self, raw: Any):
+        super().__init__(raw)
+        self._metadata: dict[str, Any] | None = None
+
     def as_array(self) -> Any:
-        sitk = _import_simpleitk()
-        if sitk is not None and isinstance(self.raw, sitk.Image):
-            return sitk.GetArrayFromImage(self.raw)
+        if _is_simpleitk_image(self.raw):
+            return _import_simpleitk().GetArrayFromImage(self.raw)
         if hasattr(self.raw, "__array__"):
             np = _import_numpy()
             if np is not None:
                 return np.asarray(self.raw)
         raise UnsupportedVoxValueError(self.raw)
 
+    def _header_array(self) -> Any:
+        """Return an array exposing dtype/shape without copying SimpleITK pixels."""
+        if _is_simpleitk_image(self.raw):
+            return _import_simpleitk().GetArrayViewFromImage(self.raw)
+        return self.as_array()
+
     def storage_metadata(self) -> dict[str, Any]:
-        sitk = _import_simpleitk()
-        if sitk is not None and isinstance(self.raw, sitk.Image):
-            return {
-                "runtime": "simpleitk",
-                "spacing": [float(v) for v in self.raw.GetSpacing()],
-                "origin": [float(v) for v in self.raw.GetOrigin()],
-                "direction": [float(v) for v in self.raw.GetDirection()],
-                "components": int(self.raw.GetNumberOfComponentsPerPixel()),
-            }
-        return {"runtime": "array"}
+        if self._metadata is None:
+            if _is_simpleitk_image(self.raw):
+                # Geometry is cached as tuples; callers get fresh lists.
+                self._metadata = {
+                    "runtime": "simpleitk",
+                    "spacing": tuple(float(v) for v in self.raw.GetSpacing()),
+                    "origin": tuple(float(v) for v in self.raw.GetOrigin()),
+                    "direction": tuple(float(v) for v in self.raw.GetDirection()),
+                    "components": int(self.raw.GetNumberOfComponentsPerPixel()),
+                }
+            else:
+                self._metadata = {"runtime": "array"}
+        return {
+            key: list(value) if isinstance(value, tuple) else value
+            for key, value in self._metadata.items()
+        }
 
     def describe(self, *, path: str = "") -> dict[str, Any]:
-        array = self.as_array()
+        array = self._header_array()
         payload = self.descriptor_base(path=path, can_descend=True)
         payload["summary"] = {
             "dtype": str(array.dtype),
@@ -277,9 +362,41 @@ def restore_runtime_image(payload_json: dict[str, Any], array: Any) -> Any:
     return image
 
 
-def adapt_runtime_value(value: Any) -> VoxValue:
+# Exact-type fast path for ``adapt_runtime_value``. Floats are excluded because
+# their vox type depends on the value (non-finite floats are unsupported), and
+# subclasses deliberately miss this table so they keep the isinstance ordering.
+_EXACT_TYPE_ADAPTERS: dict[type, Callable[[Any], VoxValue]] = {
+    type(None): lambda value: VoxScalarValue(value, "null"),
+    bool: lambda value: VoxScalarValue(value, "boolean"),
+    int: lambda value: VoxScalarValue(value, "integer"),
+    str: lambda value: VoxScalarValue(value, "string"),
+    bytes: VoxBytesValue,
+    dict: VoxMappingValue,
+    list: VoxSequenceValue,
+    tuple: VoxSequenceValue,
+    range: VoxSequenceValue,
+    OverlayValue: VoxOverlayValue,
+}
+
+
+@lru_cache(maxsize=1)
+def _register_optional_type_adapters() -> None:
+    """Add the optional numpy/SimpleITK types to the fast path, once."""
     np = _import_numpy()
+    if np is not None:
+        _EXACT_TYPE_ADAPTERS[np.ndarray] = VoxNdArrayValue
     sitk = _import_simpleitk()
+    if sitk is not None:
+        _EXACT_TYPE_ADAPTERS[sitk.Image] = VoxImageValue
+
+
+def adapt_runtime_value(value: Any) -> VoxValue:
+    adapter = _EXACT_TYPE_ADAPTERS.get(type(value))
+    if adapter is not None:
+        return adapter(value)
+
+    _register_optional_type_adapters()
+    np = _import_numpy()
     if value is None:
         return VoxScalarValue(value, "null")
     if isinstance(value, bool):
@@ -300,7 +417,7 @@ def adapt_runtime_value(value: Any) -> VoxValue:
         return VoxMappingValue(value)
     if _is_sequence_value(value) or isinstance(value, (list, tuple, range)):
         return VoxSequenceValue(value)
-    if sitk is not None and isinstance(value, sitk.Image):
+    if _is_simpleitk_image(value):
         #print(value)
         return VoxImageValue(value)
     # print(value)
@@ -1,15 +1,19 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+import hashlib
 import json
 import os
 import platform
 import shutil
 import stat
-import urllib.request
 import zipfile
 
+import httpx
+
 
 LEGACY_BIN_ENV = "VOXLOGICA1_EXPERIMENTAL_BIN"
 DEFAULT_LEGACY_BIN = Path("/tmp/VoxLogicA-experimental/src/bin/Release/net9.0/osx-x64/VoxLogicA")
@@ -18,6 +22,14 @@ PINNED_RELEASE_TAG = "v1.3.3-experimental"
 PINNED_RELEASE_PAGE = f"https://github.com/vincenzoml/VoxLogicA/releases/tag/{PINNED_RELEASE_TAG}"
 RELEASE_TAG_API = f"https://api.github.com/repos/vincenzoml/VoxLogicA/releases/tags/{PINNED_RELEASE_TAG}"
 REPO_ROOT = Path(__file__).resolve().parents[1]
+_BINARY_NAMES = frozenset({"VoxLogicA", "VoxLogicA.exe"})
+
+_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+_EXTRACT_WORKERS = 8
+# Debug symbols and docs in the publish archive are never loaded by the binary.
+_SKIPPED_SUFFIXES = frozenset({".pdb", ".dbg", ".md"})
+
+_client: httpx.Client | None = None
 
 
 @dataclass(frozen=True)
@@ -27,6 +39,7 @@ class DownloadedBinary:
     asset_name: str
 
 
+@lru_cache(maxsize=1)
 def _rid_candidates() -> tuple[str, ...]:
     system = platform.system().lower()
     machine = platform.machine().lower()
@@ -49,7 +62,13 @@ def _rid_candidates() -> tuple[str, ...]:
 
 
 def _cache_dir() -> Path:
-    configured = os.environ.get(VOX1_CACHE_DIR_ENV)
+    return _prepare_cache_dir(os.environ.get(VOX1_CACHE_DIR_ENV))
+
+
+@lru_cache(maxsize=8)
+def _prepare_cache_dir(configured: str | None) -> Path:
+    # Keyed on the env value so overriding it still takes effect, while the
+    # mkdir happens once per distinct directory.
     if configured:
         root = Path(configured).expanduser()
     else:
@@ -58,18 +77,61 @@ def _cache_dir() -> Path:
     return root
 
 
-def _release_json() -> dict:
-    headers = {"Accept": "application/vnd.github+json", "User-Agent": "voxlogica-ci"}
+def get_client() -> httpx.Client:
+    """Return the shared HTTP client used for release lookups and downloads.
+
+    Keeping one client alive lets the API call and the asset download reuse
+    pooled connections instead of paying a fresh TLS handshake each. Tests
+    may replace ``_client`` to intercept traffic.
+    """
+    global _client
+    if _client is None:
+        _client = httpx.Client(
+            follow_redirects=True,
+            timeout=httpx.Timeout(120.0, connect=10.0),
+            transport=httpx.HTTPTransport(
+                retries=3,
+                limits=httpx.Limits(max_connections=4, max_keepalive_connections=2),
+            ),
+        )
+    return _client
+
+
+def _github_headers(accept: str) -> dict[str, str]:
+    headers = {"Accept": accept, "User-Agent": "voxlogica-ci"}
     token = os.environ.get("GITHUB_TOKEN") or os.environ.get("GH_TOKEN")
     if token:
         headers["Authorization"] = f"Bearer {token}"
-    req = urllib.request.Request(
-        RELEASE_TAG_API,
-        headers=headers,
-    )
-    with urllib.request.urlopen(req, timeout=60) as response:  # noqa: S310
-        payload = response.read()
-    data = json.loads(payload.decode("utf-8"))
+    return headers
+
+
+def _load_cached_release(cache_file: Path) -> dict | None:
+    try:
+        cached = json.loads(cache_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or not cached.get("etag"):
+        return None
+    return cached
+
+
+def _release_json() -> dict:
+    # The pinned release rarely changes, so revalidate a cached copy with its
+    # ETag; a 304 answer carries no body.
+    cache_file = _cache_dir() / f"release-{PINNED_RELEASE_TAG}.json"
+    cached = _load_cached_release(cache_file)
+    headers = _github_headers("application/vnd.github+json")
+    if cached is not None:
+        headers["If-None-Match"] = str(cached["etag"])
+    response = get_client().get(RELEASE_TAG_API, headers=headers, timeout=60)
+    if cached is not None and response.status_code == 304:
+        data = cached.get("body")
+    else:
+        response.raise_for_status()
+        data = json.loads(response.content)
+        etag = response.headers.get("ETag")
+        if etag and isinstance(data, dict):
+            cache_file.write_text(json.dumps({"etag": etag, "body": data}), encoding="utf-8")
     if not isinstance(data, dict):
         raise RuntimeError("Unexpected GitHub release response format")
     if str(data.get("tag_name", "")) != PINNED_RELEASE_TAG:
@@ -119,24 +181,123 @@ def _pick_release_asset(release: dict, rid_candidates: tuple[str, ...]) -> dict:
 
 
 def _find_binary(extracted_root: Path) -> Path:
-    candidates: list[Path] = []
-    for entry in extracted_root.rglob("*"):
-        if not entry.is_file():
-            continue
-        if entry.name in {"VoxLogicA", "VoxLogicA.exe"}:
-            candidates.append(entry)
-    if not candidates:
+    # A binary next to stdlib.imgql is the real entry point, so take the first
+    # one found; otherwise fall back to the shallowest candidate.
+    best: tuple[int, Path] | None = None
+    for dirpath, dirnames, filenames in os.walk(extracted_root):
+        dirnames.sort()
+        names = set(filenames)
+        for name in sorted(names & _BINARY_NAMES):
+            candidate = Path(dirpath) / name
+            if "stdlib.imgql" in names:
+                return _make_executable(candidate)
+            depth = len(candidate.parts)
+            if best is None or depth < best[0]:
+                best = (depth, candidate)
+    if best is None:
         raise RuntimeError(f"No VoxLogicA binary found under {extracted_root}")
-
-    def _score(path: Path) -> tuple[int, int]:
-        has_stdlib = 1 if (path.parent / "stdlib.imgql").exists() else 0
-        depth = len(path.parts)
-        return (has_stdlib, -depth)
-
-    best = sorted(candidates, key=_score, reverse=True)[0]
-    mode = best.stat().st_mode
-    best.chmod(mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
-    return best
+    return _make_executable(best[1])
+
+
+def _make_executable(path: Path) -> Path:
+    mode = path.stat().st_mode
+    path.chmod(mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    return path
+
+
+def _extract_members(zip_path: Path, root: Path, members: list[zipfile.ZipInfo]) -> None:
+    # Each worker opens its own handle: ZipFile readers share one file position.
+    with zipfile.ZipFile(zip_path) as archive:
+        for info in members:
+            target = root / info.filename
+            with archive.open(info) as src, target.open("wb") as dst:
+                shutil.copyfileobj(src, dst, length=_DOWNLOAD_CHUNK_SIZE)
+            mode = (info.external_attr >> 16) & 0o777
+            if mode:
+                target.chmod(mode)
+
+
+def _extract_archive(zip_path: Path, destination: Path) -> None:
+    """Extract ``zip_path`` into ``destination``, keeping the archived file modes.
+
+    Directories are created up front; file members are then decompressed by a
+    small thread pool, since zlib and file writes release the GIL.
+    """
+    root = destination.resolve()
+    with zipfile.ZipFile(zip_path) as archive:
+        infos = archive.infolist()
+    files: list[zipfile.ZipInfo] = []
+    for info in infos:
+        target = (root / info.filename).resolve()
+        if not target.is_relative_to(root):
+            raise RuntimeError(f"Refusing to extract {info.filename!r} outside {root}")
+        if info.is_dir():
+            target.mkdir(parents=True, exist_ok=True)
+            continue
+        if target.suffix.lower() in _SKIPPED_SUFFIXES:
+            continue
+        target.parent.mkdir(parents=True, exist_ok=True)
+        files.append(info)
+
+    workers = max(1, min(_EXTRACT_WORKERS, os.cpu_count() or 1, len(files)))
+    if workers == 1:
+        _extract_members(zip_path, root, files)
+        return
+    batches = [files[index::workers] for index in range(workers)]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for future in [pool.submit(_extract_members, zip_path, root, batch) for batch in batches]:
+            future.result()
+
+
+def _expected_sha256(asset: dict) -> str | None:
+    digest = str(asset.get("digest") or "")
+    if digest.startswith("sha256:"):
+        return digest.removeprefix("sha256:").lower()
+    return None
+
+
+def _hash_file_into(hasher, path: Path):
+    # Chunked rather than hashlib.file_digest, which needs Python 3.11.
+    with path.open("rb") as handle:
+        while chunk := handle.read(_DOWNLOAD_CHUNK_SIZE):
+            hasher.update(chunk)
+    return hasher
+
+
+def _sha256_file(path: Path) -> str:
+    return _hash_file_into(hashlib.sha256(), path).hexdigest()
+
+
+def _download_asset(asset_url: str, zip_path: Path) -> str:
+    """Stream ``asset_url`` to ``zip_path`` and return its SHA-256 hex digest.
+
+    Bytes land in a ``.part`` file first; if an earlier run was interrupted,
+    the download resumes from where that file ends.
+    """
+    # Stream to disk so peak memory stays at one chunk, not the archive size.
+    partial = zip_path.with_name(zip_path.name + ".part")
+    headers = _github_headers("application/octet-stream")
+    existing = partial.stat().st_size if partial.exists() else 0
+    if existing:
+        headers["Range"] = f"bytes={existing}-"
+    with get_client().stream("GET", asset_url, headers=headers) as response:
+        if existing and response.status_code == 416:
+            # The partial file no longer lines up with the asset; start over.
+            partial.unlink()
+            return _download_asset(asset_url, zip_path)
+        response.raise_for_status()
+        hasher = hashlib.sha256()
+        if existing and response.status_code == 206:
+            _hash_file_into(hasher, partial)
+            mode = "ab"
+        else:
+            mode = "wb"
+        with partial.open(mode) as handle:
+            for chunk in response.iter_bytes(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                hasher.update(chunk)
+                handle.write(chunk)
+    partial.replace(zip_path)
+    return hasher.hexdigest()
 
 
 def download_legacy_binary_from_releases() -> DownloadedBinary:
@@ -156,30 +317,48 @@ def download_legacy_binary_from_releases() -> DownloadedBinary:
     extracted_dir = cache_root / asset_name.removesuffix(".zip")
     marker = extracted_dir / ".ready"
 
-    if not marker.exists():
-        if not zip_path.exists():
-            headers = {"Accept": "application/octet-stream", "User-Agent": "voxlogica-ci"}
-            token = os.environ.get("GITHUB_TOKEN") or os.environ.get("GH_TOKEN")
-            if token:
-                headers["Authorization"] = f"Bearer {token}"
-            req = urllib.request.Request(
-                asset_url,
-                headers=headers,
-            )
-            with urllib.request.urlopen(req, timeout=120) as response:  # noqa: S310
-                zip_path.write_bytes(response.read())
+    expected_digest = _expected_sha256(asset)
+    ready_digest = marker.read_text(encoding="utf-8").strip() if marker.exists() else None
+    if ready_digest is None or (expected_digest and ready_digest != expected_digest):
+        digest = _sha256_file(zip_path) if zip_path.exists() else None
+        if digest is not None and expected_digest and digest != expected_digest:
+            # A truncated or corrupted archive from an earlier run; fetch it again.
+            zip_path.unlink()
+            digest = None
+        if digest is None:
+            digest = _download_asset(asset_url, zip_path)
+            if expected_digest and digest != expected_digest:
+                zip_path.unlink()
+                raise RuntimeError(
+                    f"Checksum mismatch for release asset '{asset_name}': expected "
+                    f"sha256:{expected_digest}, got sha256:{digest}"
+                )
 
         if extracted_dir.exists():
             shutil.rmtree(extracted_dir)
         extracted_dir.mkdir(parents=True, exist_ok=True)
-        with zipfile.ZipFile(zip_path) as archive:
-            archive.extractall(extracted_dir)
-        marker.write_text("ok", encoding="utf-8")
+        _extract_archive(zip_path, extracted_dir)
+        marker.write_text(digest, encoding="utf-8")
 
     binary = _find_binary(extracted_dir)
     return DownloadedBinary(binary=binary, release_tag=release_tag, asset_name=asset_name)
 
 
+def _find_cached_binary(cache: Path) -> Path | None:
+    # Any binary in the cache will do, so return the first one scandir yields;
+    # DirEntry type checks reuse the readdir data instead of stat-ing each path.
+    pending = [cache]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(Path(entry.path))
+                elif entry.name in _BINARY_NAMES and entry.is_file():
+                    return Path(entry.path)
+    return None
+
+
+@lru_cache(maxsize=2)
 def resolve_legacy_binary_path(auto_download: bool = True) -> Path | None:
     configured = os.environ.get(LEGACY_BIN_ENV)
     if configured:
@@ -193,9 +372,9 @@ def resolve_legacy_binary_path(auto_download: bool = True) -> Path | None:
     # Reuse any previously downloaded binary in cache before hitting network.
     cache = _cache_dir() / PINNED_RELEASE_TAG
     if cache.exists():
-        for candidate in sorted(cache.rglob("*")):
-            if candidate.is_file() and candidate.name in {"VoxLogicA", "VoxLogicA.exe"}:
-                return candidate
+        cached = _find_cached_binary(cache)
+        if cached is not None:
+            return cached
 
     if not auto_download:
         return None
@@ -4,13 +4,10 @@ import pytest
 
 from voxlogica.lazy.ir import NodeSpec
 from voxlogica.primitives.api import PrimitiveCall
-from voxlogica.primitives.registry import PrimitiveRegistry
 
 
 @pytest.mark.contract
-def test_primitive_specs_have_required_contract_fields():
-    registry = PrimitiveRegistry()
-
+def test_primitive_specs_have_required_contract_fields(primitive_registry):
     for name in [
         "default.addition",
         "default.range",
@@ -19,7 +16,7 @@ def test_primitive_specs_have_required_contract_fields():
         "default.load",
         "default.print_primitive",
     ]:
-        spec = registry.resolve(name)
+        spec = primitive_registry.resolve(name)
         assert spec.name
         assert spec.namespace
         assert spec.kernel_name
@@ -30,11 +27,7 @@ def test_primitive_specs_have_required_contract_fields():
 
 
 @pytest.mark.contract
-def test_all_registered_primitives_use_stable_contract():
-    registry = PrimitiveRegistry()
-    for namespace in registry.list_namespaces():
-        registry.import_namespace(namespace)
-
-    specs = [registry.get_spec(name) for name in registry.list_primitives().keys()]
+def test_all_registered_primitives_use_stable_contract(primitive_registry):
+    specs = list(primitive_registry.iter_all_specs())
     assert specs, "Expected at least one registered primitive"
     assert not any(spec.is_legacy_adapter for spec in specs)
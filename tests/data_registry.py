@@ -51,12 +51,12 @@ def write_deterministic_color_sample(root: Path) -> Path:
     """Write a deterministic RGB image sample and return the path."""
     root.mkdir(parents=True, exist_ok=True)
     color_path = root / "color.png"
-    color = np.zeros((9, 11, 3), dtype=np.uint8)
-    color[..., 0] = np.linspace(0, 255, 11, dtype=np.uint8)
-    color[..., 1] = np.linspace(255, 0, 9, dtype=np.uint8)[:, None]
-    color[..., 2] = (
-        (color[..., 0].astype(np.uint16) + color[..., 1].astype(np.uint16)) // 2
-    ).astype(np.uint8)
+    # Channels are built as broadcastable rows/columns in uint16 so the
+    # blue average cannot overflow, then stacked into uint8 in one pass.
+    red = np.linspace(0, 255, 11, dtype=np.uint16)[None, :]
+    green = np.linspace(255, 0, 9, dtype=np.uint16)[:, None]
+    blue = (red + green) // 2
+    color = np.stack(np.broadcast_arrays(red, green, blue), axis=-1, dtype=np.uint8)
     color_img = sitk.GetImageFromArray(color, isVector=True)
     sitk.WriteImage(color_img, str(color_path))
     return color_path
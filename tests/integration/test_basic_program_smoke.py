@@ -7,13 +7,12 @@ from voxlogica.execution import ExecutionEngine
 
 @pytest.mark.integration
 def test_basic_program_smoke_execution(reduce_from_text, sample_dataset_file):
-    program = """
+    program = f"""
 let f(x,y) = x + y
 let y = f(2,3)
 print "sum" y
-print "rows" load("__DATASET__")
+print "rows" load("{sample_dataset_file}")
 """
-    program = program.replace("__DATASET__", str(sample_dataset_file))
     workplan = reduce_from_text(program)
 
     engine = ExecutionEngine()
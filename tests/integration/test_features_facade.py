@@ -5,12 +5,19 @@ from pathlib import Path
 
 import pytest
 
-from voxlogica.features import FeatureRegistry
+
+@pytest.fixture(scope="module")
+def feature_registry():
+    # Imported lazily so collecting this module does not load the whole
+    # feature facade (parser, reducer, execution strategies).
+    from voxlogica.features import FeatureRegistry
+
+    return FeatureRegistry
 
 
 @pytest.mark.integration
-def test_version_feature_contract():
-    feature = FeatureRegistry.get_feature("version")
+def test_version_feature_contract(feature_registry):
+    feature = feature_registry.get_feature("version")
     assert feature is not None
 
     result = feature.handler()
@@ -21,8 +28,8 @@ def test_version_feature_contract():
 
 
 @pytest.mark.integration
-def test_run_feature_basic_program_and_exports(tmp_path: Path):
-    feature = FeatureRegistry.get_feature("run")
+def test_run_feature_basic_program_and_exports(feature_registry, tmp_path: Path):
+    feature = feature_registry.get_feature("run")
     assert feature is not None
 
     program = """let a = 1
@@ -63,8 +70,8 @@ print "sum" c"""
 
 
 @pytest.mark.integration
-def test_run_feature_rejects_invalid_program():
-    feature = FeatureRegistry.get_feature("run")
+def test_run_feature_rejects_invalid_program(feature_registry):
+    feature = feature_registry.get_feature("run")
     assert feature is not None
 
     result = feature.handler(program="invalid syntax here", execute=False)
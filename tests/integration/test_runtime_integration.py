@@ -9,8 +9,22 @@ import pytest
 from voxlogica.execution import ExecutionEngine
 
 
+@pytest.fixture(scope="module")
+def dask_engine() -> ExecutionEngine:
+    return ExecutionEngine()
+
+
+@pytest.fixture(scope="module")
+def prepared_load(dask_engine: ExecutionEngine, reduce_from_text, sample_dataset_file: Path):
+    program = f'print "rows" load("{sample_dataset_file}")'
+    workplan = reduce_from_text(program)
+    goal_id = workplan.to_symbolic_plan().goals[0].id
+    prepared = dask_engine.compile_plan(workplan, strategy="dask")
+    return prepared, goal_id
+
+
 @pytest.mark.integration
-def test_for_loop_executes_on_dask_strategy(reduce_from_text):
+def test_for_loop_executes_on_dask_strategy(reduce_from_text, dask_engine: ExecutionEngine):
     program = """
 let inc(x)=x+1
 print "out" for x in range(0,5) do inc(x)
@@ -18,39 +32,31 @@ print "out" for x in range(0,5) do inc(x)
     workplan = reduce_from_text(program)
     plan = workplan.to_symbolic_plan()
 
-    engine = ExecutionEngine()
-    prepared = engine.compile_plan(workplan, strategy="dask")
+    prepared = dask_engine.compile_plan(workplan, strategy="dask")
     goal_id = plan.goals[0].id
 
-    page = engine.page(prepared, goal_id, offset=0, limit=10, strategy="dask")
+    page = dask_engine.page(prepared, goal_id, offset=0, limit=10, strategy="dask")
     assert page.items == [1.0, 2.0, 3.0, 4.0, 5.0]
 
 
 @pytest.mark.integration
-def test_stream_and_page_without_full_materialization(reduce_from_text, sample_dataset_file: Path):
-    program = f'print "rows" load("{sample_dataset_file}")'
-    workplan = reduce_from_text(program)
-    plan = workplan.to_symbolic_plan()
-    goal_id = plan.goals[0].id
-
-    engine = ExecutionEngine()
-    prepared = engine.compile_plan(workplan, strategy="dask")
+def test_stream_and_page_without_full_materialization(dask_engine: ExecutionEngine, prepared_load):
+    prepared, goal_id = prepared_load
 
-    first_two_chunks = list(islice(engine.stream(prepared, goal_id, chunk_size=2, strategy="dask"), 2))
+    first_two_chunks = list(islice(dask_engine.stream(prepared, goal_id, chunk_size=2, strategy="dask"), 2))
     assert first_two_chunks == [["alpha", "beta"], ["gamma", "delta"]]
 
-    page = engine.page(prepared, goal_id, offset=1, limit=2, strategy="dask")
+    page = dask_engine.page(prepared, goal_id, offset=1, limit=2, strategy="dask")
     assert page.items == ["beta", "gamma"]
 
 
 @pytest.mark.integration
-def test_save_goal_writes_output(reduce_from_text, tmp_path: Path):
+def test_save_goal_writes_output(reduce_from_text, dask_engine: ExecutionEngine, tmp_path: Path):
     output_path = tmp_path / "result.json"
     program = f'save "{output_path}" for x in range(0,3) do x+1'
     workplan = reduce_from_text(program)
 
-    engine = ExecutionEngine()
-    result = engine.execute_workplan(workplan, strategy="dask")
+    result = dask_engine.execute_workplan(workplan, strategy="dask")
 
     assert result.success
     assert output_path.exists()
@@ -4,16 +4,15 @@ from dataclasses import dataclass
 from pathlib import Path
 import re
 import subprocess
+from typing import TYPE_CHECKING
 
-import numpy as np
 import pytest
-import SimpleITK as sitk
 
-from tests._vox1_binary import LEGACY_BIN_ENV, resolve_legacy_binary_path
-from tests.data_registry import write_deterministic_color_sample, write_deterministic_gray_pair
-from voxlogica.execution_strategy.strict import StrictExecutionStrategy
-from voxlogica.parser import parse_program_content
-from voxlogica.reducer import reduce_program
+if TYPE_CHECKING:
+    import SimpleITK as sitk
+
+
+_LEGACY_RES_RE = re.compile(r"\[user\]\s+res_(?P<name>\w+)=(?P<value>[^\n]+)")
 
 
 @dataclass(frozen=True)
@@ -120,20 +119,12 @@ IMAGE_CASES: tuple[ParityCase, ...] = (
 ALL_CASES: tuple[ParityCase, ...] = SCALAR_CASES + IMAGE_CASES
 
 
-@pytest.fixture(scope="session")
-def legacy_binary() -> Path:
-    resolved = resolve_legacy_binary_path(auto_download=True)
-    if resolved is not None:
-        return resolved
-    pytest.skip(
-        f"Legacy VoxLogicA binary unavailable. Set {LEGACY_BIN_ENV} or allow "
-        "release download from GitHub."
-    )
-    raise AssertionError("unreachable")
-
-
 @pytest.fixture(scope="session")
 def parity_inputs(tmp_path_factory: pytest.TempPathFactory) -> dict[str, Path]:
+    # Heavy imaging imports stay out of collection; skip cleanly when absent.
+    pytest.importorskip("SimpleITK")
+    from tests.data_registry import write_deterministic_color_sample, write_deterministic_gray_pair
+
     root = tmp_path_factory.mktemp("vox1_legacy_parity")
     gray = write_deterministic_gray_pair(
         root,
@@ -202,11 +193,8 @@ def _run_legacy(
     )
 
 
-def _parse_legacy_scalar(stdout: str) -> bool | float:
-    match = re.search(r"\[user\]\s+res=([^\n]+)", stdout)
-    if match is None:
-        raise AssertionError(f"Missing legacy scalar output in:\n{stdout}")
-    raw = match.group(1).strip()
+def _parse_legacy_scalar(raw: str) -> bool | float:
+    raw = raw.strip()
     lowered = raw.lower()
     if lowered == "true":
         return True
@@ -215,7 +203,66 @@ def _parse_legacy_scalar(stdout: str) -> bool | float:
     return float(raw)
 
 
+@dataclass(frozen=True)
+class LegacyOutputs:
+    values: dict[str, bool | float | Path]
+    failures: dict[str, str]
+
+    def get(self, case: ParityCase) -> bool | float | Path:
+        """Return the legacy result for ``case``, failing with its domain's run output."""
+        failure = self.failures.get(case.domain)
+        if failure is not None:
+            pytest.fail(failure, pytrace=False)
+        value = self.values.get(case.name)
+        if value is None:
+            raise AssertionError(f"Missing legacy output for {case.name}")
+        return value
+
+
+@pytest.fixture(scope="session")
+def legacy_outputs(
+    legacy_binary_path: Path,
+    parity_inputs: dict[str, Path],
+    tmp_path_factory: pytest.TempPathFactory,
+) -> LegacyOutputs:
+    """Run every legacy case of a domain in one process and index results by case name.
+
+    Scalar cases map to their printed value, image cases to the saved file. A
+    failed run is recorded against its domain so only that domain's cases fail.
+    """
+    root = tmp_path_factory.mktemp("vox1_legacy_outputs")
+    outputs: dict[str, bool | float | Path] = {}
+    failures: dict[str, str] = {}
+    for domain in sorted({case.domain for case in ALL_CASES}):
+        workdir = root / domain
+        workdir.mkdir()
+        lines = [_build_prelude(domain, "legacy", parity_inputs)]
+        for case in ALL_CASES:
+            if case.domain != domain:
+                continue
+            if case.kind == "scalar":
+                lines.append(f'print "res_{case.name}" {case.legacy_expr}\n')
+            else:
+                output = workdir / f"legacy_{case.name}.nii.gz"
+                lines.append(f'save "{output}" {case.legacy_expr}\n')
+                outputs[case.name] = output
+        legacy_run = _run_legacy(legacy_binary_path, workdir, "".join(lines))
+        if legacy_run.returncode != 0:
+            failures[domain] = (
+                f"Legacy run failed for domain {domain}\n"
+                f"STDOUT:\n{legacy_run.stdout}\nSTDERR:\n{legacy_run.stderr}"
+            )
+            continue
+        for match in _LEGACY_RES_RE.finditer(legacy_run.stdout):
+            outputs[match.group("name")] = _parse_legacy_scalar(match.group("value"))
+    return LegacyOutputs(values=outputs, failures=failures)
+
+
 def _run_v2(program_text: str):
+    from voxlogica.execution_strategy.strict import StrictExecutionStrategy
+    from voxlogica.parser import parse_program_content
+    from voxlogica.reducer import reduce_program
+
     program = parse_program_content(program_text)
     work_plan = reduce_program(program)
     strategy = StrictExecutionStrategy(registry=work_plan.registry)
@@ -236,9 +283,15 @@ def _assert_scalar_parity(expected, actual, atol: float) -> None:
 
 
 def _assert_image_parity(expected: sitk.Image, actual: sitk.Image, atol: float) -> None:
+    import numpy as np
+    import SimpleITK as sitk
+
     expected_arr = sitk.GetArrayFromImage(expected)
     actual_arr = sitk.GetArrayFromImage(actual)
     assert expected_arr.shape == actual_arr.shape
+    if expected_arr.dtype == actual_arr.dtype and np.array_equal(expected_arr, actual_arr):
+        # Bit-identical output is the common case; skip the tolerance pass.
+        return
 
     if np.issubdtype(expected_arr.dtype, np.floating) or np.issubdtype(actual_arr.dtype, np.floating):
         assert np.allclose(expected_arr, actual_arr, atol=atol, rtol=1e-5, equal_nan=True)
@@ -251,21 +304,13 @@ def _assert_image_parity(expected: sitk.Image, actual: sitk.Image, atol: float)
 @pytest.mark.parametrize("case", ALL_CASES, ids=[case.name for case in ALL_CASES])
 def test_vox1_matches_legacy_experimental_operator_by_operator(
     case: ParityCase,
-    legacy_binary: Path,
+    legacy_outputs: LegacyOutputs,
     parity_inputs: dict[str, Path],
-    tmp_path: Path,
 ):
-    legacy_prelude = _build_prelude(case.domain, "legacy", parity_inputs)
     v2_prelude = _build_prelude(case.domain, "v2", parity_inputs)
 
     if case.kind == "scalar":
-        legacy_program = f"{legacy_prelude}print \"res\" {case.legacy_expr}\n"
-        legacy_run = _run_legacy(legacy_binary, tmp_path, legacy_program)
-        assert legacy_run.returncode == 0, (
-            f"Legacy run failed for {case.name}\n"
-            f"STDOUT:\n{legacy_run.stdout}\nSTDERR:\n{legacy_run.stderr}"
-        )
-        legacy_value = _parse_legacy_scalar(legacy_run.stdout)
+        legacy_value = legacy_outputs.get(case)
 
         seed = ""
         if case.domain == "gray":
@@ -277,13 +322,9 @@ def test_vox1_matches_legacy_experimental_operator_by_operator(
         _assert_scalar_parity(legacy_value, v2_value, case.atol)
         return
 
-    legacy_output = tmp_path / f"legacy_{case.name}.nii.gz"
-    legacy_program = f'{legacy_prelude}save "{legacy_output}" {case.legacy_expr}\n'
-    legacy_run = _run_legacy(legacy_binary, tmp_path, legacy_program)
-    assert legacy_run.returncode == 0, (
-        f"Legacy run failed for {case.name}\n"
-        f"STDOUT:\n{legacy_run.stdout}\nSTDERR:\n{legacy_run.stderr}"
-    )
+    import SimpleITK as sitk
+
+    legacy_output = legacy_outputs.get(case)
     assert legacy_output.exists(), f"Legacy output missing for {case.name}: {legacy_output}"
     legacy_image = sitk.ReadImage(str(legacy_output))
 
@@ -0,0 +1,239 @@
+"""Perf telemetry hooks: per-test timing and memory metrics for ``perf`` tests."""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+import json
+import os
+from pathlib import Path
+import sys
+import threading
+import time
+import tracemalloc
+
+import pytest
+
+
+PERF_TRACEMALLOC_ENV = "VOXLOGICA_PERF_TRACEMALLOC"
+PERF_REPORT_DIR_ENV = "VOXLOGICA_PERF_REPORT_DIR"
+PERF_METRICS_JSONL = "perf_test_metrics.jsonl"
+RSS_SAMPLE_INTERVAL_S = 0.05
+
+
+@dataclass(slots=True)
+class PerfRecord:
+    """Telemetry for one perf test; converted to a dict only when written."""
+
+    test_id: str
+    outcome: str
+    wall_time_s: float
+    cpu_time_s: float
+    cpu_utilization: float
+    ru_maxrss_before_bytes: int
+    ru_maxrss_after_bytes: int
+    ru_maxrss_delta_bytes: int
+    ru_maxrss_test_delta_bytes: int
+    ru_maxrss_since_session_start_bytes: int
+    peak_rss_bytes: int | None
+    delta_rss_bytes: int | None
+    python_heap_current_bytes: int | None
+    python_heap_peak_bytes: int | None
+
+
+# ru_maxrss is reported in bytes on macOS and in KiB elsewhere.
+_RU_MAXRSS_SCALE = 1 if sys.platform == "darwin" else 1024
+
+
+def _ru_maxrss_bytes() -> int:
+    import resource
+
+    return int(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * _RU_MAXRSS_SCALE)
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    output_root = _perf_report_dir()
+    if output_root is not None:
+        (output_root / PERF_METRICS_JSONL).unlink(missing_ok=True)
+    # ru_maxrss only ever grows within a process, so per-test deltas are taken
+    # against the previous high-water mark rather than a fresh reading.
+    baseline = _ru_maxrss_bytes()
+    setattr(config, "_vox_perf_rss_baseline", baseline)
+    setattr(config, "_vox_perf_rss_prev", baseline)
+    # Whole-run heap tracing instruments the allocator once, at the first perf
+    # test, and resets the peak per test instead of restarting tracemalloc.
+    setattr(config, "_vox_perf_session_tracing", os.environ.get(PERF_TRACEMALLOC_ENV) == "1")
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    if getattr(config, "_vox_perf_session_tracing", False) and tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+
+class _RssSampler:
+    """Track the peak resident set size of this process from a daemon thread.
+
+    Polling RSS keeps allocation-heavy perf tests at native speed, unlike
+    tracemalloc, which hooks every Python allocation.
+    """
+
+    def __init__(self, interval_s: float = RSS_SAMPLE_INTERVAL_S) -> None:
+        self._interval_s = interval_s
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._process = None
+        self.start_bytes: int | None = None
+        self.peak_bytes: int | None = None
+
+    def _sample(self) -> None:
+        rss = int(self._process.memory_info().rss)
+        if self.peak_bytes is None or rss > self.peak_bytes:
+            self.peak_bytes = rss
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval_s):
+            self._sample()
+
+    def start(self) -> None:
+        try:
+            import psutil
+        except ImportError:
+            return
+        self._process = psutil.Process(os.getpid())
+        self._sample()
+        self.start_bytes = self.peak_bytes
+        self._thread = threading.Thread(target=self._run, name="vox-perf-rss", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._sample()
+
+
+def _perf_report_dir() -> Path | None:
+    report_dir = os.environ.get(PERF_REPORT_DIR_ENV)
+    if not report_dir:
+        return None
+    output_root = Path(report_dir).expanduser()
+    output_root.mkdir(parents=True, exist_ok=True)
+    return output_root
+
+
+def _record_perf_metric(request: pytest.FixtureRequest, record: PerfRecord) -> None:
+    config = request.config
+    if not hasattr(config, "_vox_perf_metrics"):
+        setattr(config, "_vox_perf_metrics", [])
+    metrics: list[PerfRecord] = getattr(config, "_vox_perf_metrics")
+    metrics.append(record)
+    output_root = _perf_report_dir()
+    if output_root is None:
+        return
+    # Stream one line per test so partial runs still leave usable metrics.
+    with (output_root / PERF_METRICS_JSONL).open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps(asdict(record), sort_keys=True) + "\n")
+
+
+def _dump_report(payload: dict[str, object]) -> bytes:
+    try:
+        import orjson
+    except ImportError:
+        return json.dumps(payload, indent=2, sort_keys=True).encode("utf-8")
+    return orjson.dumps(payload, option=orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item: pytest.Item, call: pytest.CallInfo[None]):
+    outcome = yield
+    rep = outcome.get_result()
+    setattr(item, f"rep_{rep.when}", rep)
+
+
+@pytest.fixture(autouse=True)
+def _collect_perf_telemetry(request: pytest.FixtureRequest):
+    marker = request.node.get_closest_marker("perf")
+    if marker is None:
+        yield
+        return
+
+    # Python heap tracing is opt-in, per test via ``perf(track_heap=True)`` or
+    # for the whole run via the env var: tracemalloc slows allocation-heavy
+    # code by integer factors and would distort the timings recorded below.
+    session_tracing = bool(getattr(request.config, "_vox_perf_session_tracing", False))
+    trace_heap = session_tracing or bool(marker.kwargs.get("track_heap", False))
+    sampler = _RssSampler()
+    start_wall = time.perf_counter()
+    start_cpu = time.process_time()
+    rss_before = _ru_maxrss_bytes()
+    sampler.start()
+    heap_base = 0
+    if session_tracing:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(1)
+        tracemalloc.reset_peak()
+        heap_base = tracemalloc.get_traced_memory()[0]
+    elif trace_heap:
+        tracemalloc.start(1)
+    try:
+        yield
+    finally:
+        heap_current: int | None = None
+        heap_peak: int | None = None
+        if trace_heap:
+            current_bytes, peak_bytes = tracemalloc.get_traced_memory()
+            if not session_tracing:
+                tracemalloc.stop()
+            heap_current = max(0, int(current_bytes) - heap_base)
+            heap_peak = max(0, int(peak_bytes) - heap_base)
+        sampler.stop()
+        wall_s = max(0.0, time.perf_counter() - start_wall)
+        cpu_s = max(0.0, time.process_time() - start_cpu)
+        rss_after = _ru_maxrss_bytes()
+        config = request.config
+        rss_prev = getattr(config, "_vox_perf_rss_prev", rss_before)
+        rss_baseline = getattr(config, "_vox_perf_rss_baseline", rss_before)
+        setattr(config, "_vox_perf_rss_prev", max(rss_prev, rss_after))
+        rep = getattr(request.node, "rep_call", None)
+        outcome = rep.outcome if rep is not None else "unknown"
+        peak_rss = sampler.peak_bytes
+        _record_perf_metric(
+            request,
+            PerfRecord(
+                test_id=request.node.nodeid,
+                outcome=outcome,
+                wall_time_s=wall_s,
+                cpu_time_s=cpu_s,
+                cpu_utilization=(cpu_s / wall_s) if wall_s > 0 else 0.0,
+                ru_maxrss_before_bytes=rss_before,
+                ru_maxrss_after_bytes=rss_after,
+                ru_maxrss_delta_bytes=max(0, rss_after - rss_before),
+                ru_maxrss_test_delta_bytes=max(0, rss_after - rss_prev),
+                ru_maxrss_since_session_start_bytes=max(0, rss_after - rss_baseline),
+                peak_rss_bytes=peak_rss,
+                delta_rss_bytes=(
+                    max(0, peak_rss - sampler.start_bytes)
+                    if peak_rss is not None and sampler.start_bytes is not None
+                    else None
+                ),
+                python_heap_current_bytes=heap_current,
+                python_heap_peak_bytes=heap_peak,
+            ),
+        )
+
+
+def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
+    config = session.config
+    metrics: list[PerfRecord] = getattr(config, "_vox_perf_metrics", [])
+    if not metrics:
+        return
+    output_root = _perf_report_dir()
+    if output_root is None:
+        return
+    payload = {
+        "generated_at": time.time(),
+        "exitstatus": int(exitstatus),
+        "count": len(metrics),
+        "tests": [asdict(record) for record in metrics],
+    }
+    (output_root / "perf_test_metrics.json").write_bytes(_dump_report(payload))
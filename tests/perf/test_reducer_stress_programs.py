@@ -1,28 +1,26 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 import pytest
 
 
+@lru_cache(maxsize=None)
 def _fibonacci_chain_program(depth: int) -> str:
     lines = ["let f0 = 1", "let f1 = 1"]
-    for i in range(2, depth + 1):
-        lines.append(f"let f{i} = f{i-1} + f{i-2}")
+    lines.extend(f"let f{i} = f{i-1} + f{i-2}" for i in range(2, depth + 1))
     lines.append(f'print "fib{depth}" f{depth}')
     return "\n".join(lines)
 
 
+@lru_cache(maxsize=None)
 def _function_explosion_program(depth: int) -> str:
     lines = ["let f0(x) = 1", "let f1(x) = 1"]
-    for i in range(2, depth + 1):
-        prev1 = f"f{i-1}(x+1)"
-        prev2 = f"f{i-2}(x-1)"
-        prev3 = f"f{i-1}(x*2)"
-        prev4 = f"f{i-2}(x/2)"
-        prev5 = f"f{i-1}(x)"
-        prev6 = f"f{i-2}(x)"
-        lines.append(
-            f"let f{i}(x) = {prev1} + {prev2} + {prev3} + {prev4} + {prev5} + {prev6}"
-        )
+    lines.extend(
+        f"let f{i}(x) = f{i-1}(x+1) + f{i-2}(x-1) + f{i-1}(x*2)"
+        f" + f{i-2}(x/2) + f{i-1}(x) + f{i-2}(x)"
+        for i in range(2, depth + 1)
+    )
     lines.append(f'print "function_explosion_f{depth}" f{depth}(1)')
     return "\n".join(lines)
 
@@ -13,7 +13,6 @@ import tracemalloc
 
 import pytest
 
-from tests._vox1_binary import LEGACY_BIN_ENV, resolve_legacy_binary_path
 from tests.data_registry import write_deterministic_gray_pair
 from voxlogica.execution_strategy.strict import StrictExecutionStrategy
 from voxlogica.parser import parse_program_content
@@ -311,18 +310,6 @@ def _write_report(rows: list[dict[str, float | str]], svg: Path) -> None:
     )
 
 
-@pytest.fixture(scope="session")
-def legacy_binary() -> Path:
-    resolved = resolve_legacy_binary_path(auto_download=True)
-    if resolved is not None:
-        return resolved
-    pytest.skip(
-        f"Legacy VoxLogicA binary unavailable. Set {LEGACY_BIN_ENV} or allow "
-        "release download from GitHub."
-    )
-    raise AssertionError("unreachable")
-
-
 @pytest.fixture(scope="session")
 def perf_inputs(tmp_path_factory: pytest.TempPathFactory) -> dict[str, Path]:
     root = tmp_path_factory.mktemp("vox1_primitive_perf_inputs")
@@ -332,7 +319,7 @@ def perf_inputs(tmp_path_factory: pytest.TempPathFactory) -> dict[str, Path]:
 @pytest.mark.perf
 @pytest.mark.slow
 def test_vox1_primitive_benchmarks_generate_histogram(
-    legacy_binary: Path,
+    legacy_binary_path: Path,
     perf_inputs: dict[str, Path],
     tmp_path: Path,
 ):
@@ -345,10 +332,10 @@ def test_vox1_primitive_benchmarks_generate_histogram(
         v2_text, _ = _build_program(v2_prelude, case)
 
         for _ in range(PERF_WARMUP_RUNS):
-            _run_legacy(legacy_binary, tmp_path, legacy_text)
+            _run_legacy(legacy_binary_path, tmp_path, legacy_text)
             _run_v2(v2_text)
 
-        legacy_samples = [_run_legacy(legacy_binary, tmp_path, legacy_text) for _ in range(PERF_SAMPLE_RUNS)]
+        legacy_samples = [_run_legacy(legacy_binary_path, tmp_path, legacy_text) for _ in range(PERF_SAMPLE_RUNS)]
         v2_samples = [_run_v2(v2_text) for _ in range(PERF_SAMPLE_RUNS)]
 
         legacy_median = statistics.median(float(sample["wall_time_s"]) for sample in legacy_samples)
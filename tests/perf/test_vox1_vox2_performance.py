@@ -12,7 +12,6 @@ import tracemalloc
 
 import pytest
 
-from tests._vox1_binary import LEGACY_BIN_ENV, resolve_legacy_binary_path
 from tests.data_registry import write_deterministic_gray_pair
 from voxlogica.execution_strategy.strict import StrictExecutionStrategy
 from voxlogica.parser import parse_program_content
@@ -217,18 +216,6 @@ def _write_perf_report(
     )
 
 
-@pytest.fixture(scope="session")
-def legacy_binary() -> Path:
-    resolved = resolve_legacy_binary_path(auto_download=True)
-    if resolved is not None:
-        return resolved
-    pytest.skip(
-        f"Legacy VoxLogicA binary unavailable. Set {LEGACY_BIN_ENV} or allow "
-        "release download from GitHub."
-    )
-    raise AssertionError("unreachable")
-
-
 @pytest.fixture(scope="session")
 def perf_inputs(tmp_path_factory: pytest.TempPathFactory) -> dict[str, Path]:
     root = tmp_path_factory.mktemp("vox1_vox2_perf_inputs")
@@ -238,7 +225,7 @@ def perf_inputs(tmp_path_factory: pytest.TempPathFactory) -> dict[str, Path]:
 @pytest.mark.perf
 @pytest.mark.slow
 def test_vox1_vs_vox2_perf_comparison_generates_graph(
-    legacy_binary: Path,
+    legacy_binary_path: Path,
     perf_inputs: dict[str, Path],
     tmp_path: Path,
 ):
@@ -246,10 +233,10 @@ def test_vox1_vs_vox2_perf_comparison_generates_graph(
     v2_text, _ = _v2_program(perf_inputs, "res")
 
     for _ in range(PERF_WARMUP_RUNS):
-        _run_legacy(legacy_binary, tmp_path, legacy_text)
+        _run_legacy(legacy_binary_path, tmp_path, legacy_text)
         _run_v2(v2_text)
 
-    legacy_samples = [_run_legacy(legacy_binary, tmp_path, legacy_text) for _ in range(PERF_SAMPLE_RUNS)]
+    legacy_samples = [_run_legacy(legacy_binary_path, tmp_path, legacy_text) for _ in range(PERF_SAMPLE_RUNS)]
     v2_samples = [_run_v2(v2_text) for _ in range(PERF_SAMPLE_RUNS)]
 
     legacy_median = statistics.median(float(sample["wall_time_s"]) for sample in legacy_samples)
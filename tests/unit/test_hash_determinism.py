@@ -40,3 +40,33 @@ def test_hash_normalizes_kwarg_order():
     )
 
     assert hash_node(node_a) == hash_node(node_b)
+
+
+@pytest.mark.unit
+def test_hash_matches_canonical_payload_and_keeps_scalar_types_apart():
+    import hashlib
+    import json
+
+    from voxlogica.lazy.hash import node_payload
+
+    nodes = [
+        NodeSpec(kind="constant", operator="constant", attrs={"value": value}, output_kind="scalar")
+        for value in (1, 1.0, True, "1", None)
+    ]
+    node_ids = [hash_node(node) for node in nodes]
+    assert len(set(node_ids)) == len(nodes)
+    for node, node_id in zip(nodes, node_ids):
+        canonical = json.dumps(node_payload(node), sort_keys=True, separators=(",", ":"), ensure_ascii=True)
+        assert node_id == hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+@pytest.mark.unit
+def test_hash_keeps_signed_zero_constants_apart():
+    positive, negative = (
+        NodeSpec(kind="constant", operator="constant", attrs={"value": value}, output_kind="scalar")
+        for value in (0.0, -0.0)
+    )
+    positive_id = hash_node(positive)
+
+    assert hash_node(negative) != positive_id
+    assert hash_node(positive) == positive_id
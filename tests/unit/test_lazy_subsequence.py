@@ -56,3 +56,22 @@ def test_seq_avg_via_fold_executes(capsys: pytest.CaptureFixture[str]) -> None:
     assert "mean=2" in output
     assert "slice_mean=4" in output
     assert "subseq_mean=4" in output
+
+
+@pytest.mark.unit
+def test_sequence_value_page_stops_reading_after_window() -> None:
+    from voxlogica.execution_strategy.results import SequenceValue
+
+    consumed: list[int] = []
+
+    def produce():
+        for index in range(100):
+            consumed.append(index)
+            yield index
+
+    sequence = SequenceValue(produce)
+    assert sequence.page(3, 4) == [3, 4, 5, 6]
+    assert consumed == [0, 1, 2, 3, 4, 5, 6]
+    assert sequence.page(98, 10) == [98, 99]
+    with pytest.raises(ValueError):
+        sequence.page(-1, 2)
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from voxlogica.parser import Declaration, ECall, ENumber, parse_program, parse_program_content
+
+
+@pytest.mark.unit
+def test_call_str_renders_arguments_inline() -> None:
+    call = ECall("pos", "f", (ENumber(1.0), ECall("pos", "x", ())))
+    assert str(call) == "f(1.0, x)"
+    assert call.to_syntax() == "f(1.0,x)"
+
+
+@pytest.mark.unit
+def test_program_to_syntax_round_trips() -> None:
+    source = 'let f(a,b)=+(a,b)\nprint "r" f(1.0,2.0)'
+    program = parse_program_content(source)
+    assert isinstance(program.commands[0], Declaration)
+    assert program.to_syntax() == source
+    assert parse_program_content(program.to_syntax()) == program
+
+
+@pytest.mark.unit
+def test_ast_nodes_are_hashable_and_immutable() -> None:
+    first = parse_program_content("let y = f(x, [1, 2])", source_name="a.imgql")
+    second = parse_program_content("let y = f(x, [1, 2])", source_name="a.imgql")
+    assert hash(first) == hash(second)
+    assert len({first.commands[0].expression, second.commands[0].expression}) == 1
+    with pytest.raises(AttributeError):
+        first.commands[0].expression.identifier = "g"
+
+
+@pytest.mark.unit
+def test_parse_program_reuses_unchanged_files(tmp_path: Path) -> None:
+    source = tmp_path / "lib.imgql"
+    source.write_text("let a = 1\n", encoding="utf-8")
+    first = parse_program(source)
+    assert parse_program(source) is first
+
+    source.write_text("let a = 1\nlet b = 2\n", encoding="utf-8")
+    updated = parse_program(source)
+    assert updated is not first
+    assert [cmd.identifier for cmd in updated.commands] == ["a", "b"]
+
+
+@pytest.mark.unit
+def test_parse_program_content_is_safe_across_threads() -> None:
+    from concurrent.futures import ThreadPoolExecutor
+
+    sources = [f'let v{index} = f({index}, [true, x[1:]])\nprint "p{index}" v{index}' for index in range(32)]
+    expected = [parse_program_content(source, source_name=f"s{index}") for index, source in enumerate(sources)]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        parsed = list(pool.map(lambda item: parse_program_content(item[1], source_name=f"s{item[0]}"), enumerate(sources)))
+
+    assert parsed == expected
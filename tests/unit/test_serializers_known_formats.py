@@ -60,3 +60,32 @@ def test_overlay_roundtrip_binary_codec() -> None:
     assert decoded.layers[1].label == "Overlay 1"
     assert np.array_equal(decoded.layers[0].value, np.zeros((3, 3, 3), dtype=np.float32))
     assert np.array_equal(decoded.layers[1].value, np.ones((3, 3, 3), dtype=np.float32))
+
+
+@pytest.mark.unit
+def test_simpleitk_image_descriptor_matches_pixel_array() -> None:
+    np = pytest.importorskip("numpy")
+    sitk = pytest.importorskip("SimpleITK")
+    image = sitk.GetImageFromArray(np.zeros((2, 3, 5), dtype=np.int16))
+    image.SetOrigin((1.0, 2.0, 3.0))
+    encoded = encode_for_storage(image)
+    summary = encoded.descriptor["summary"]
+    assert summary["dtype"] == "int16"
+    assert summary["shape"] == [2, 3, 5]
+    assert summary["size"] == 30
+    assert summary["origin"] == [1.0, 2.0, 3.0]
+    assert encoded.payload_json["metadata"]["runtime"] == "simpleitk"
+
+
+@pytest.mark.unit
+def test_simpleitk_image_metadata_copies_are_independent() -> None:
+    np = pytest.importorskip("numpy")
+    sitk = pytest.importorskip("SimpleITK")
+    from voxlogica.value_model import VoxImageValue
+
+    value = VoxImageValue(sitk.GetImageFromArray(np.zeros((2, 2, 2), dtype=np.uint8)))
+    value.storage_metadata()["spacing"].append(9.0)
+    value.describe()["summary"]["origin"][0] = 5.0
+    metadata = value.storage_metadata()
+    assert metadata["spacing"] == [1.0, 1.0, 1.0]
+    assert metadata["origin"] == [0.0, 0.0, 0.0]
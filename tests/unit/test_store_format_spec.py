@@ -3,7 +3,7 @@ from __future__ import annotations
 import pytest
 
 from voxlogica.pod_codec import encode_for_storage
-from voxlogica.value_model import OverlayValue
+from voxlogica.value_model import OverlayValue, UnsupportedVoxValueError, adapt_runtime_value
 
 
 @pytest.mark.unit
@@ -51,3 +51,64 @@ def test_overlay_envelope_embeds_layers_and_metadata() -> None:
     assert encoded.payload_json["layers"][0]["colormap"] == "gray"
     assert encoded.payload_json["layers"][1]["label"] == "Overlay 1"
     assert encoded.payload_json["metadata"] == {"study": "demo"}
+
+
+@pytest.mark.unit
+def test_mapping_descriptor_previews_first_keys_only() -> None:
+    encoded = encode_for_storage({f"k{index}": index for index in range(40)})
+    summary = encoded.descriptor["summary"]
+    assert summary["length"] == 40
+    assert summary["keys_preview"] == [f"k{index}" for index in range(16)]
+    assert summary["truncated"] is True
+
+
+@pytest.mark.unit
+def test_adapt_runtime_value_keeps_subclass_dispatch_order() -> None:
+    class Label(str):
+        pass
+
+    assert adapt_runtime_value(True).vox_type == "boolean"
+    assert adapt_runtime_value(7).vox_type == "integer"
+    assert adapt_runtime_value(Label("tumour")).vox_type == "string"
+    assert adapt_runtime_value(1.5).vox_type == "number"
+    with pytest.raises(UnsupportedVoxValueError):
+        adapt_runtime_value(float("nan"))
+
+
+@pytest.mark.unit
+def test_sequence_descriptor_counts_unsized_lazy_sequences() -> None:
+    from voxlogica.execution_strategy.results import SequenceValue
+
+    adapted = adapt_runtime_value(SequenceValue(lambda: iter(range(5))))
+    assert adapted.describe()["summary"] == {"length": 5}
+    assert adapt_runtime_value(range(3, 10)).describe()["summary"] == {"length": 7}
+
+
+@pytest.mark.unit
+def test_lazy_sequence_is_walked_once_during_encoding() -> None:
+    from voxlogica.execution_strategy.results import SequenceValue
+
+    walks: list[int] = []
+
+    def factory():
+        walks.append(1)
+        return iter([1, 2, 3])
+
+    encoded = encode_for_storage(SequenceValue(factory))
+    assert encoded.descriptor["summary"] == {"length": 3}
+    assert encoded.payload_json["value"] == [1, 2, 3]
+    assert len(walks) == 1
+
+
+@pytest.mark.unit
+def test_adapted_values_do_not_carry_instance_dicts() -> None:
+    for value in (None, 3, "text", b"raw", {"a": 1}, [1, 2]):
+        assert not hasattr(adapt_runtime_value(value), "__dict__")
+
+
+@pytest.mark.unit
+def test_primitive_containers_convert_to_json_and_still_reject_nan() -> None:
+    encoded = encode_for_storage({"a": 1, "b": "x", "c": None, "d": [True, 2.5, {"e": 3}]})
+    assert encoded.payload_json["value"] == {"a": 1, "b": "x", "c": None, "d": [True, 2.5, {"e": 3}]}
+    with pytest.raises(UnsupportedVoxValueError):
+        encode_for_storage([1, float("inf")])